@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Constantes y helpers compartidos por normalize_mc2020.py y normalize_oa20251.py
+"""
+
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+DATAFILES = Path("src/datafiles")
+
+# Mapeo de correcciones de nombres (MC2020 y OA20251 DEBEN COINCIDIR).
+# MappingProxyType: solo lectura, compartido sin riesgo entre ambos scripts.
+CORRECTIONS = MappingProxyType({
+    "CIT1010": "PROGRAMACIÓN",  # La primera aparición es correcta
+    "CBM1006": "CÁLCULO II",
+    "CII2100": "INTRODUCCIÓN A LA ECONOMÍA",  # Normalizar espacios
+    "CIT3325": "INTELIGENCIA ARTIFICIAL",
+    "CIT2009": "BASES DE DATOS",
+    "CIT2207": "EVALUACIÓN DE PROYECTOS TIC",
+    "CIT3203": "PROYECTO EN TICS I",
+    "CIT5002": "PRÁCTICA PROFESIONAL 1",
+    "CIG1003": "INGLÉS GENERAL I",
+})
+
+# Códigos a corregir como ndarray, para isin sin reconstruir la lista
+CORRECTION_CODES = np.array(list(CORRECTIONS), dtype=object)
+
+
+def apply_corrections(df: pd.DataFrame, code_col: str, name_col: str) -> list:
+    """
+    Reemplazar en df[name_col] el nombre de los códigos presentes en CORRECTIONS.
+
+    Modifica df en su lugar y retorna la lista de códigos corregidos (uno por
+    fila reemplazada), para que cada script arme su propio resumen.
+    """
+    # Posiciones de columna resueltas una vez; correcciones sobre ndarrays
+    code_idx = df.columns.get_loc(code_col)
+    name_idx = df.columns.get_loc(name_col)
+    codes_arr = df.iloc[:, code_idx].to_numpy()
+    names_arr = df.iloc[:, name_idx].to_numpy(dtype=object, copy=True)
+    # isin de pandas (hash) en vez de np.isin: la columna puede mezclar str y NaN
+    replace_idx = np.flatnonzero(df.iloc[:, code_idx].isin(CORRECTION_CODES).to_numpy())
+    names_arr[replace_idx] = [CORRECTIONS[c] for c in codes_arr[replace_idx]]
+    df.isetitem(name_idx, names_arr)
+    return codes_arr[replace_idx].tolist()
+
+
+# Clave en los metadatos del schema parquet con la firma del xlsx de origen
+_SIDECAR_KEY = b"ga_backend.source"
+
+
+def _source_signature(path: Path) -> bytes:
+    """(st_mtime_ns, st_size) del xlsx: cambia también al restaurar un backup con cp -p"""
+    st = path.stat()
+    return f"{st.st_mtime_ns}:{st.st_size}".encode()
+
+
+def read_excel_cached(path: Path) -> pd.DataFrame:
+    """Leer un xlsx usando el sidecar .parquet si corresponde a ese xlsx (calamine si no)"""
+    parquet = path.with_suffix(".parquet")
+    if parquet.exists():
+        try:
+            import pyarrow.parquet as pq
+            # Solo el footer: el sidecar vale si fue escrito desde este mismo xlsx
+            metadata = pq.read_schema(parquet).metadata or {}
+            if metadata.get(_SIDECAR_KEY) == _source_signature(path):
+                return pd.read_parquet(parquet, engine="pyarrow")
+        except (ImportError, ValueError, OSError):
+            # Sidecar ilegible o sin pyarrow: releer el xlsx
+            pass
+
+    try:
+        df = pd.read_excel(path, engine="calamine")
+    except (ImportError, ValueError):
+        # python-calamine no instalado (ImportError) o pandas < 2.2 sin el
+        # engine (ValueError "Unknown engine"): volver a openpyxl
+        df = pd.read_excel(path)
+
+    write_parquet_sidecar(df, path)
+    return df
+
+
+def write_parquet_sidecar(df: pd.DataFrame, path: Path) -> None:
+    """Guardar df junto a path como .parquet, firmado con el (mtime, tamaño) de path"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = {**(table.schema.metadata or {}), _SIDECAR_KEY: _source_signature(path)}
+        pq.write_table(table.replace_schema_metadata(metadata), path.with_suffix(".parquet"),
+                       compression="zstd")
+    except (ImportError, ValueError, TypeError):
+        # Sin pyarrow o columnas con tipos mixtos (ArrowInvalid/ArrowTypeError
+        # derivan de ValueError/TypeError): seguir sin sidecar
+        pass
+
+
+def write_excel(df: pd.DataFrame, path: Path) -> None:
+    """Escribir xlsx con xlsxwriter si está disponible (más rápido que openpyxl)"""
+    try:
+        df.to_excel(path, index=False, engine="xlsxwriter")
+    except ImportError:
+        df.to_excel(path, index=False)
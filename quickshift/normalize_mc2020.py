@@ -3,29 +3,21 @@
 Normalizar MC2020.xlsx - corregir nombres y eliminar duplicados
 """
 
-import pandas as pd
-from pathlib import Path
+from normalize_common import (
+    CORRECTIONS,
+    DATAFILES,
+    apply_corrections,
+    read_excel_cached,
+    write_excel,
+    write_parquet_sidecar,
+)
 
-DATAFILES = Path("src/datafiles")
-
-# Mapeo de correcciones de nombres
-CORRECTIONS = {
-    "CIT1010": "PROGRAMACIÓN",  # La primera aparición es correcta
-    "CBM1006": "CÁLCULO II",
-    "CII2100": "INTRODUCCIÓN A LA ECONOMÍA",  # Normalizar espacios
-    "CIT3325": "INTELIGENCIA ARTIFICIAL",
-    "CIT2009": "BASES DE DATOS",
-    "CIT2207": "EVALUACIÓN DE PROYECTOS TIC",
-    "CIT3203": "PROYECTO EN TICS I",
-    "CIT5002": "PRÁCTICA PROFESIONAL 1",
-    "CIG1003": "INGLÉS GENERAL I",
-}
 
 def normalize_mc2020():
     print("📋 Normalizando MC2020.xlsx...")
     
     # Leer archivo
-    df = pd.read_excel(DATAFILES / "MC2020.xlsx")
+    df = read_excel_cached(DATAFILES / "MC2020.xlsx")
     
     print(f"\n📊 Estado inicial:")
     print(f"   Filas totales: {len(df)}")
@@ -33,23 +25,26 @@ def normalize_mc2020():
     
     # Aplicar correcciones de nombres
     print(f"\n🔧 Aplicando correcciones:")
+    matched = set(apply_corrections(df, 'Código', 'Nombre Asignatura'))
     for code, correct_name in CORRECTIONS.items():
-        mask = df['Código'] == code
-        if mask.any():
+        if code in matched:
             print(f"   {code}: '{correct_name}'")
-            df.loc[mask, 'Nombre Asignatura'] = correct_name
     
     # Eliminar duplicados (mantener primera ocurrencia)
-    duplicates_before = len(df)
-    df = df.drop_duplicates(subset=['Código'], keep='first')
-    duplicates_removed = duplicates_before - len(df)
+    # Sobre códigos enteros de la categoría en vez de hashear strings
+    codes_cat = df['Código'].astype('category')
+    mask = ~codes_cat.cat.codes.duplicated(keep='first')
+    df = df.loc[mask].reset_index(drop=True)
+    duplicates_removed = int((~mask).sum())
     
     if duplicates_removed > 0:
         print(f"\n❌ Duplicados eliminados: {duplicates_removed}")
     
     # Guardar
     output = DATAFILES / "MC2020_normalizado.xlsx"
-    df.to_excel(output, index=False)
+    write_excel(df, output)
+    # normalize_oa20251 relee este archivo: dejarle el sidecar listo
+    write_parquet_sidecar(df, output)
     
     print(f"\n✅ Normalización completada")
     print(f"   Filas después: {len(df)}")
@@ -58,8 +53,9 @@ def normalize_mc2020():
     
     # Mostrar lista de cursos
     print(f"\n📚 Cursos normalizados ({len(df)}):")
-    for idx, row in df.iterrows():
-        print(f"   {row['Código']}: {row['Nombre Asignatura']}")
+    codes = df['Código'].to_numpy()
+    names = df['Nombre Asignatura'].to_numpy()
+    print('\n'.join(f"   {c}: {n}" for c, n in zip(codes, names)))
 
 if __name__ == "__main__":
     normalize_mc2020()
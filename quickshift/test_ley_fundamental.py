@@ -12,16 +12,48 @@ Uso: python3 test_ley_fundamental.py [--server http://localhost:8080]
 
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sys
-from typing import List, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Dict, Tuple, FrozenSet, Optional
+
+try:
+    import orjson
+    _dumps, _loads = orjson.dumps, orjson.loads
+except ImportError:
+    # Sin orjson: mismo contrato (bytes de entrada/salida) con el json estándar
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    _loads = json.loads
+
+@dataclass(slots=True)
+class CasoResultado:
+    """Resultado de un caso contra /solve"""
+    test_name: str
+    passed: bool
+    reason: str
 
 class TestLeyFundamental:
-    def __init__(self, server_url: str = "http://127.0.0.1:8080"):
+    def __init__(self, server_url: str = "http://127.0.0.1:8080", max_workers: int = 8):
         self.server_url = server_url
         self.endpoint = f"{server_url}/solve"
         self.passed = 0
         self.failed = 0
-        self.results = []
+        self.results: List[CasoResultado] = []
+        self.max_workers = max_workers
+        # Una sola sesión: reutiliza la conexión TCP (keep-alive) entre llamadas a /solve
+        self.session = requests.Session()
+        self.session.headers.update({"Content-Type": "application/json"})
+        # Reintentar errores transitorios del servidor en vez de contar un fallo.
+        # read=0: un read timeout es un cálculo largo de /solve; reintentarlo
+        # solo lanzaría otra ejecución del solver sobre un servidor ya cargado
+        retry = Retry(total=3, read=0, backoff_factor=0.1, status_forcelist=(502, 503, 504),
+                      allowed_methods=frozenset(["POST"]))
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     # Cursos por semestre (basado en Malla2020.xlsx)
     CURSOS_POR_SEMESTRE = [
@@ -45,6 +77,23 @@ class TestLeyFundamental:
         ["CII1015", "CII1016", "CII1017", "CII1018", "CBF1009", "CBM1013"],
     ]
 
+    # (connect, read): fallar rápido al conectar, esperar el cálculo de /solve
+    TIMEOUT = (2, 20)
+
+    # Campos fijos del payload de /solve (solo cambia "ramos_pasados")
+    _PAYLOAD_BASE = {
+        "email": "test@x.com",
+        "malla": "Malla2020.xlsx",
+        "sheet": "Malla 2020",
+        "ramos_prioritarios": [],
+        "horarios_preferidos": [],
+        "filtros": {}
+    }
+
+    # Constantes derivadas (no cambian entre casos)
+    _ALL_CURSOS = frozenset(c for sem in CURSOS_POR_SEMESTRE for c in sem)
+    _TOTAL_CURSOS = len(_ALL_CURSOS)
+
     def test_ley_fundamental_completa(self) -> bool:
         """
         Itera por semestres 1-9 aprobando cursos uno por uno.
@@ -57,66 +106,63 @@ class TestLeyFundamental:
         print("🔬 TEST: LEY FUNDAMENTAL - Iteración por semestres (3+ contextos)")
         print("="*70)
 
+        # Construir todos los casos primero (snapshots de ramos_aprobados) para
+        # poder lanzarlos en paralelo; las líneas de log se imprimen en orden.
+        casos = []
+        pendientes = []
         ramos_aprobados = []
-        contador_total = 0
+        ramos_frozen = frozenset()
 
         for sem_idx, cursos_sem in enumerate(self.CURSOS_POR_SEMESTRE):
             semestre = sem_idx + 1
-            print(f"\n📚 SEMESTRE {semestre}")
-            print(f"   Cursos disponibles: {len(cursos_sem)}")
+            pendientes.append(f"\n📚 SEMESTRE {semestre}")
+            pendientes.append(f"   Cursos disponibles: {len(cursos_sem)}")
 
             for idx, curso in enumerate(cursos_sem):
                 # Agregar el curso a los aprobados (persistente)
                 ramos_aprobados.append(curso)
-                contador_total += 1
+                ramos_frozen = ramos_frozen | {curso}
+
+                pendientes.append(f"\n   ✓ Aprobado: {curso} ({idx+1}/{len(cursos_sem)})")
+                pendientes.append(f"     Total aprobados: {len(ramos_aprobados)}")
 
-                print(f"\n   ✓ Aprobado: {curso} ({idx+1}/{len(cursos_sem)})")
-                print(f"     Total aprobados: {len(ramos_aprobados)}")
+                # Malla completa: 0 soluciones es válido (VALIDACIÓN 1 no aplica),
+                # pero /solve se llama igual para la VALIDACIÓN 2 (sin aprobados)
+                if not self._ALL_CURSOS - ramos_frozen:
+                    pendientes.append("     ℹ️  Todos los cursos aprobados: solo se valida que no aparezcan aprobados")
 
                 # CONTEXTO 1: Solo cursos hasta este punto
-                test_passed_1 = self._test_caso_individual(
-                    semestre=semestre,
-                    ramos_aprobados=ramos_aprobados.copy(),
-                    idx_en_semestre=idx + 1,
-                    contexto=1
-                )
-                if test_passed_1:
-                    self.passed += 1
-                else:
-                    self.failed += 1
+                contextos = [(1, ramos_aprobados.copy(), ramos_frozen)]
 
                 # CONTEXTO 2: Simular que el estudiante aprobó además 1 curso aleatorio de otro semestre
-                ramos_con_extra = ramos_aprobados.copy()
                 if sem_idx > 0:
-                    ramos_con_extra.append(self.CURSOS_POR_SEMESTRE[sem_idx - 1][0])
-                    test_passed_2 = self._test_caso_individual(
-                        semestre=semestre,
-                        ramos_aprobados=ramos_con_extra,
-                        idx_en_semestre=idx + 1,
-                        contexto=2
-                    )
-                    if test_passed_2:
-                        self.passed += 1
-                    else:
-                        self.failed += 1
+                    extra = [self.CURSOS_POR_SEMESTRE[sem_idx - 1][0]]
+                    contextos.append((2, ramos_aprobados + extra, ramos_frozen.union(extra)))
 
                 # CONTEXTO 3: Simular que el estudiante aprobó además 2 cursos más
-                ramos_con_mas_extra = ramos_aprobados.copy()
                 if sem_idx > 1:
-                    ramos_con_mas_extra.extend([
+                    extra = [
                         self.CURSOS_POR_SEMESTRE[sem_idx - 2][0],
                         self.CURSOS_POR_SEMESTRE[sem_idx - 1][1]
-                    ])
-                    test_passed_3 = self._test_caso_individual(
-                        semestre=semestre,
-                        ramos_aprobados=ramos_con_mas_extra,
-                        idx_en_semestre=idx + 1,
-                        contexto=3
-                    )
-                    if test_passed_3:
-                        self.passed += 1
-                    else:
-                        self.failed += 1
+                    ]
+                    contextos.append((3, ramos_aprobados + extra, ramos_frozen.union(extra)))
+
+                for contexto, ramos, ramos_set in contextos:
+                    casos.append((pendientes, (semestre, ramos, idx + 1, contexto, ramos_set)))
+                    pendientes = []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # executor.map preserva el orden de los casos
+            resultados = executor.map(self._test_caso_individual_args, [args for _, args in casos])
+            for (lineas, _), (passed, result, mensaje) in zip(casos, resultados):
+                for linea in lineas:
+                    print(linea)
+                print(mensaje)
+                self.results.append(result)
+                if passed:
+                    self.passed += 1
+                else:
+                    self.failed += 1
 
         # Resumen
         print("\n" + "="*70)
@@ -132,79 +178,73 @@ class TestLeyFundamental:
         if self.failed > 0:
             print(f"\n⚠️  FALLOS DETECTADOS:\n")
             for result in self.results:
-                if not result["passed"]:
-                    print(f"  ❌ {result['test_name']}")
-                    print(f"     Razón: {result['reason']}")
+                if not result.passed:
+                    print(f"  ❌ {result.test_name}")
+                    print(f"     Razón: {result.reason}")
 
         print("\n" + "="*70)
         return self.failed == 0
 
-    def _test_caso_individual(self, semestre: int, ramos_aprobados: List[str], idx_en_semestre: int, contexto: int = 1) -> bool:
-        """Ejecuta un caso individual contra /solve"""
+    def _solve_body(self, ramos_aprobados: List[str]) -> bytes:
+        """Serializa el payload de /solve (Content-Type ya está en la sesión)"""
+        return _dumps({**self._PAYLOAD_BASE, "ramos_pasados": ramos_aprobados})
+
+    def _test_caso_individual_args(self, args: Tuple[int, List[str], int, int, FrozenSet[str]]) -> Tuple[bool, CasoResultado, str]:
+        return self._test_caso_individual(*args)
+
+    def _test_caso_individual(self, semestre: int, ramos_aprobados: List[str], idx_en_semestre: int, contexto: int = 1,
+                              ramos_set: Optional[FrozenSet[str]] = None) -> Tuple[bool, CasoResultado, str]:
+        """
+        Ejecuta un caso individual contra /solve.
+
+        No modifica el estado del tester (se llama desde varios hilos): retorna
+        (passed, result, mensaje) y el llamador agrega/imprime.
+        """
+        test_name = f"Semestre {semestre} - {idx_en_semestre}/6 [CTX{contexto}]"
         try:
-            payload = {
-                "email": "test@x.com",
-                "malla": "Malla2020.xlsx",
-                "sheet": "Malla 2020",
-                "ramos_pasados": ramos_aprobados,
-                "ramos_prioritarios": [],
-                "horarios_preferidos": [],
-                "filtros": {}
-            }
-
-            response = requests.post(self.endpoint, json=payload, timeout=20)
+            body = self._solve_body(ramos_aprobados)
+            response = self.session.post(self.endpoint, data=body, timeout=self.TIMEOUT)
             response.raise_for_status()
-            data = response.json()
+            data = _loads(response.content)
 
             soluciones_count = data.get("soluciones_count", 0)
             soluciones = data.get("soluciones", [])
 
             # VALIDACIÓN 1: ¿Hay al menos 1 solución?
-            if soluciones_count == 0 and len(ramos_aprobados) < len(set(c for sem in self.CURSOS_POR_SEMESTRE for c in sem)):
-                test_name = f"Semestre {semestre} - {idx_en_semestre}/6 [CTX{contexto}]"
-                self.results.append({
-                    "test_name": test_name,
-                    "passed": False,
-                    "reason": f"LEY VIOLADA: 0 soluciones con {len(ramos_aprobados)} cursos aprobados"
-                })
-                print(f"     ❌ Contexto {contexto}: LEY VIOLADA: Sin soluciones")
-                return False
+            if soluciones_count == 0 and len(ramos_aprobados) < self._TOTAL_CURSOS:
+                return False, CasoResultado(
+                    test_name=test_name,
+                    passed=False,
+                    reason=f"LEY VIOLADA: 0 soluciones con {len(ramos_aprobados)} cursos aprobados"
+                ), f"     ❌ Contexto {contexto}: LEY VIOLADA: Sin soluciones"
 
             # VALIDACIÓN 2: ¿Hay cursos aprobados en las soluciones?
-            ramos_set = set(ramos_aprobados)
-            for sol_idx, solucion in enumerate(soluciones):
-                codigos_en_sol = [sec["codigo"] for sec in solucion["secciones"]]
-                aprobados_en_sol = [c for c in codigos_en_sol if c in ramos_set]
+            if ramos_set is None:
+                ramos_set = frozenset(ramos_aprobados)
+            for solucion in soluciones:
+                aprobados_en_sol = ramos_set.intersection(sec["codigo"] for sec in solucion["secciones"])
 
                 if aprobados_en_sol:
-                    test_name = f"Semestre {semestre} - {idx_en_semestre}/6 [CTX{contexto}]"
-                    self.results.append({
-                        "test_name": test_name,
-                        "passed": False,
-                        "reason": f"Cursos aprobados en solución: {aprobados_en_sol}"
-                    })
-                    print(f"     ❌ Contexto {contexto}: Cursos aprobados en solución: {aprobados_en_sol}")
-                    return False
+                    aprobados_en_sol = sorted(aprobados_en_sol)
+                    return False, CasoResultado(
+                        test_name=test_name,
+                        passed=False,
+                        reason=f"Cursos aprobados en solución: {aprobados_en_sol}"
+                    ), f"     ❌ Contexto {contexto}: Cursos aprobados en solución: {aprobados_en_sol}"
 
             # VALIDACIÓN 3: Contar soluciones válidas
-            test_name = f"Semestre {semestre} - {idx_en_semestre}/6 [CTX{contexto}]"
-            self.results.append({
-                "test_name": test_name,
-                "passed": True,
-                "reason": f"✅ {soluciones_count} soluciones válidas"
-            })
-            print(f"     ✅ Contexto {contexto}: {soluciones_count} soluciones válidas (sin aprobados)")
-            return True
+            return True, CasoResultado(
+                test_name=test_name,
+                passed=True,
+                reason=f"✅ {soluciones_count} soluciones válidas"
+            ), f"     ✅ Contexto {contexto}: {soluciones_count} soluciones válidas (sin aprobados)"
 
         except Exception as e:
-            test_name = f"Semestre {semestre} - {idx_en_semestre}/6 [CTX{contexto}]"
-            self.results.append({
-                "test_name": test_name,
-                "passed": False,
-                "reason": f"ERROR: {str(e)}"
-            })
-            print(f"     ❌ Contexto {contexto}: ERROR: {str(e)}")
-            return False
+            return False, CasoResultado(
+                test_name=test_name,
+                passed=False,
+                reason=f"ERROR: {str(e)}"
+            ), f"     ❌ Contexto {contexto}: ERROR: {str(e)}"
 
     def test_sin_filtros_garantia(self) -> bool:
         """Verifica que SIN FILTROS siempre hay solución"""
@@ -212,7 +252,9 @@ class TestLeyFundamental:
         print("🔬 TEST: Garantía - Sin filtros = siempre solución")
         print("="*70)
 
-        for sem_idx in range(len(self.CURSOS_POR_SEMESTRE) - 1):  # No el último
+        # El último semestre se omite: con la malla completa no hay nada que tomar
+        print(f"   (se omite el semestre {len(self.CURSOS_POR_SEMESTRE)}: malla completa)")
+        for sem_idx in range(len(self.CURSOS_POR_SEMESTRE) - 1):
             ramos_aprobados = []
             for i in range(sem_idx + 1):
                 ramos_aprobados.extend(self.CURSOS_POR_SEMESTRE[i])
@@ -220,18 +262,9 @@ class TestLeyFundamental:
             semestre = sem_idx + 1
 
             try:
-                payload = {
-                    "email": "test@x.com",
-                    "malla": "Malla2020.xlsx",
-                    "sheet": "Malla 2020",
-                    "ramos_pasados": ramos_aprobados,
-                    "ramos_prioritarios": [],
-                    "horarios_preferidos": [],
-                    "filtros": {}
-                }
-
-                response = requests.post(self.endpoint, json=payload, timeout=20)
-                data = response.json()
+                body = self._solve_body(ramos_aprobados)
+                response = self.session.post(self.endpoint, data=body, timeout=self.TIMEOUT)
+                data = _loads(response.content)
                 soluciones_count = data.get("soluciones_count", 0)
 
                 if soluciones_count > 0:
@@ -7,38 +7,44 @@ Valida que los 3 archivos Excel se pueden leer correctamente
 y genera reporte de cobertura.
 """
 
-import openpyxl
-import pandas as pd
+import sys
+import heapq
 from pathlib import Path
-from collections import defaultdict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import unicodedata
 import re
 
+from xlsx_fast import read_columns, read_rows
 
+
+_NON_ALNUM = re.compile(r'[^a-z0-9\s]')
+_WS = re.compile(r'\s+')
+# Tabla para str.translate: borra las marcas no espaciadoras (categoría Mn) del BMP
+_MARKS = dict.fromkeys(c for c in range(0x10000) if unicodedata.category(chr(c)) == 'Mn')
+
+
+@lru_cache(maxsize=8192)
 def normalize_name(s: str) -> str:
-    """Normalizar nombre igual a la función Rust"""
-    # Remover acentos
-    s = ''.join(
-        c for c in unicodedata.normalize('NFD', s)
-        if unicodedata.category(c) != 'Mn'
-    )
+    """Normalizar nombre igual a la función Rust (memoizada: función pura)"""
+    # Remover acentos (translate corre en C, sin callback por carácter)
+    s = unicodedata.normalize('NFD', s).translate(_MARKS)
     # Minúsculas, mantener solo alfanuméricos y espacios
-    s = re.sub(r'[^a-z0-9\s]', ' ', s.lower())
+    s = _NON_ALNUM.sub(' ', s.lower())
     # Colapsar espacios
-    s = ' '.join(s.split())
-    return s
+    s = _WS.sub(' ', s).strip()
+    # Internada: la misma clave de malla/OA/PA es el mismo objeto y las
+    # búsquedas en los dicts de main() comparan por puntero
+    return sys.intern(s)
 
 
 def leer_malla2020(path: str) -> dict:
     """Leer Malla2020.xlsx"""
     try:
-        wb = openpyxl.load_workbook(path)
-        ws = wb['Malla2020']
-        
         resultados = {}
-        for row_idx, row in enumerate(ws.iter_rows(min_row=2, values_only=True), 2):
-            nombre = str(row[0] or "").strip()
-            id_str = str(row[1] or "").strip()
+        for nombre, id_val in read_rows(path, 'Malla2020', columns=(0, 1), min_row=2):
+            nombre = str(nombre or "").strip()
+            id_str = str(id_val or "").strip()
             
             if nombre and id_str.isdigit():
                 nombre_norm = normalize_name(nombre)
@@ -49,60 +55,56 @@ def leer_malla2020(path: str) -> dict:
         
         return resultados
     except Exception as e:
-        print(f"❌ Error leyendo Malla2020: {e}")
+        sys.stdout.write(f"❌ Error leyendo Malla2020: {e}\n")
         return {}
 
 
 def leer_oa2024(path: str) -> dict:
-    """Leer OA2024.xlsx"""
+    """Leer OA2024.xlsx (hoja activa, como wb.active)"""
     try:
-        wb = openpyxl.load_workbook(path)
-        ws = wb.active
-        
         resultados = {}
-        for row_idx, row in enumerate(ws.iter_rows(min_row=2, values_only=True), 2):
-            codigo = str(row[1] or "").strip()
-            nombre = str(row[2] or "").strip()
+        for codigo, nombre in read_rows(path, columns=(1, 2), min_row=2):
+            codigo = str(codigo or "").strip()
+            nombre = str(nombre or "").strip()
             
             if codigo and nombre:
-                nombre_norm = normalize_name(nombre)
-                if nombre_norm not in resultados:
-                    resultados[nombre_norm] = {
-                        'nombre': nombre,
-                        'codigo': codigo,
-                    }
+                # Primera aparición gana (una sola búsqueda en el dict)
+                resultados.setdefault(normalize_name(nombre), {
+                    'nombre': nombre,
+                    'codigo': codigo,
+                })
         
         return resultados
     except Exception as e:
-        print(f"❌ Error leyendo OA2024: {e}")
+        sys.stdout.write(f"❌ Error leyendo OA2024: {e}\n")
         return {}
 
 
+PA2025_COLUMNAS = ('Código Asignatura', 'Nombre', 'Porcentaje Aprobado', 'Electivo')
+
+
 def leer_pa2025(path: str) -> dict:
-    """Leer PA2025-1.xlsx"""
+    """Leer PA2025-1.xlsx (columnas por nombre de encabezado)"""
     try:
-        df = pd.read_excel(path)
         resultados = {}
         
-        for _, row in df.iterrows():
-            codigo = str(row.get('Código Asignatura', '')).strip()
-            nombre = str(row.get('Nombre', '')).strip()
-            porcentaje = row.get('Porcentaje Aprobado')
-            es_electivo = bool(row.get('Electivo', False))
+        for codigo, nombre, porcentaje, es_electivo in read_columns(path, PA2025_COLUMNAS):
+            codigo = str(codigo or "").strip()
+            nombre = str(nombre or "").strip()
+            es_electivo = bool(es_electivo)
             
             if codigo and nombre:
-                nombre_norm = normalize_name(nombre)
-                if nombre_norm not in resultados:
-                    resultados[nombre_norm] = {
-                        'nombre': nombre,
-                        'codigo': codigo,
-                        'porcentaje': porcentaje,
-                        'es_electivo': es_electivo,
-                    }
+                # Primera aparición gana (una sola búsqueda en el dict)
+                resultados.setdefault(normalize_name(nombre), {
+                    'nombre': nombre,
+                    'codigo': codigo,
+                    'porcentaje': porcentaje,
+                    'es_electivo': es_electivo,
+                })
         
         return resultados
     except Exception as e:
-        print(f"❌ Error leyendo PA2025-1: {e}")
+        sys.stdout.write(f"❌ Error leyendo PA2025-1: {e}\n")
         return {}
 
 
@@ -115,9 +117,13 @@ def main():
     
     # Leer archivos
     print("\n📖 Leyendo archivos Excel...")
-    malla = leer_malla2020(str(data_dir / "malla2020.xlsx"))
-    oa2024 = leer_oa2024(str(data_dir / "OA2024.xlsx"))
-    pa2025 = leer_pa2025(str(data_dir / "PA2025-1.xlsx"))
+    # Los tres archivos son independientes: se leen en paralelo (la
+    # descompresión zlib y el parser XML corren en C)
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        f_malla = ex.submit(leer_malla2020, str(data_dir / "malla2020.xlsx"))
+        f_oa = ex.submit(leer_oa2024, str(data_dir / "OA2024.xlsx"))
+        f_pa = ex.submit(leer_pa2025, str(data_dir / "PA2025-1.xlsx"))
+        malla, oa2024, pa2025 = f_malla.result(), f_oa.result(), f_pa.result()
     
     print(f"  ✓ Malla2020: {len(malla)} asignaturas")
     print(f"  ✓ OA2024: {len(oa2024)} asignaturas únicas")
@@ -128,15 +134,27 @@ def main():
     print("📈 ANÁLISIS DE COBERTURA")
     print("=" * 80)
     
+    # Cobertura por intersección de vistas keys() (en C, sin copiar los dicts)
+    malla_keys = malla.keys()
+    en_oa = malla_keys & oa2024.keys()
+    malla_en_oa = len(en_oa)
+    malla_en_pa = len(malla_keys & pa2025.keys())
+    
+    # Cambios de código: solo los nombres presentes en las tres tablas
+    cambios_codigo = []
+    for norm_name in en_oa & pa2025.keys():
+        cod_oa = oa2024[norm_name]['codigo']
+        cod_pa = pa2025[norm_name]['codigo']
+        if cod_oa != cod_pa:
+            cambios_codigo.append((norm_name, malla[norm_name]['nombre'], cod_oa, cod_pa))
+    
     # Malla en OA2024
-    malla_en_oa = sum(1 for m in malla if m in oa2024)
     malla_no_en_oa = len(malla) - malla_en_oa
     print(f"\nMalla2020 → OA2024:")
     print(f"  ✓ {malla_en_oa}/{len(malla)} encontrados en OA2024")
     print(f"  ✗ {malla_no_en_oa} NO encontrados")
     
     # Malla en PA2025-1
-    malla_en_pa = sum(1 for m in malla if m in pa2025)
     malla_no_en_pa = len(malla) - malla_en_pa
     print(f"\nMalla2020 → PA2025-1:")
     print(f"  ✓ {malla_en_pa}/{len(malla)} encontrados en PA2025-1")
@@ -154,7 +172,8 @@ def main():
     print(f"\nOA2024 → PA2025-1 (CRÍTICO para schedule solver):")
     print(f"  ✓ {oa_en_pa}/{len(oa2024)} códigos de OA2024 tienen ofertas en PA2025-1")
     print(f"  ✗ {len(oa_no_en_pa)} NO tienen secciones en enero 2025:")
-    for norm, nombre, cod in sorted(oa_no_en_pa)[:5]:
+    # Solo se muestran los primeros: heap de tamaño 5 en vez de ordenar todo
+    for norm, nombre, cod in heapq.nsmallest(5, oa_no_en_pa):
         print(f"    - {cod} ({nombre})")
     if len(oa_no_en_pa) > 5:
         print(f"    ... y {len(oa_no_en_pa)-5} más")
@@ -164,22 +183,9 @@ def main():
     print("🔍 DETECCIÓN DE CAMBIOS DE CÓDIGO (Problema descubierto)")
     print("=" * 80)
     
-    cambios_codigo = []
-    for norm_name in malla:
-        if norm_name in oa2024 and norm_name in pa2025:
-            cod_oa = oa2024[norm_name].get('codigo')
-            cod_pa = pa2025[norm_name].get('codigo')
-            if cod_oa != cod_pa:
-                cambios_codigo.append((
-                    norm_name,
-                    malla[norm_name]['nombre'],
-                    cod_oa,
-                    cod_pa
-                ))
-    
     if cambios_codigo:
         print(f"\n⚠️  {len(cambios_codigo)} asignaturas tienen CÓDIGOS DIFERENTES entre años:")
-        for norm, nombre, cod_oa, cod_pa in sorted(cambios_codigo)[:10]:
+        for norm, nombre, cod_oa, cod_pa in heapq.nsmallest(10, cambios_codigo):
             print(f"  • {nombre}")
             print(f"    OA2024:  {cod_oa}")
             print(f"    PA2025:  {cod_pa}")
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Lector xlsx mínimo: zip + parser XML en streaming (iterparse).
+
+Para leer 2-3 columnas de una hoja sin levantar openpyxl/pandas. Compartido
+por verify_mapeo.py y tools/inspect_oa.py. Usa lxml (libxml2) si está
+instalado; si no, xml.etree.ElementTree.
+"""
+
+import zipfile
+import posixpath
+
+try:
+    from lxml import etree as ET
+    HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAVE_LXML = False
+
+NS_MAIN = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+NS_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+NS_PKG_REL = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+_ROW = f'{{{NS_MAIN}}}row'
+_C = f'{{{NS_MAIN}}}c'
+_V = f'{{{NS_MAIN}}}v'
+_T = f'{{{NS_MAIN}}}t'
+_IS = f'{{{NS_MAIN}}}is'
+_SI = f'{{{NS_MAIN}}}si'
+_R = f'{{{NS_MAIN}}}r'
+_SHEET_DATA = f'{{{NS_MAIN}}}sheetData'
+
+if HAVE_LXML:
+    # Sin expansión de entidades externas (mismo comportamiento que ElementTree)
+    _PARSER = ET.XMLParser(resolve_entities=False)
+    _SHEET_NAMES = ET.XPath('//m:sheets/m:sheet/@name', namespaces={'m': NS_MAIN})
+
+    def _fromstring(data):
+        return ET.fromstring(data, _PARSER)
+
+    def _iter_tag(f, tag, parent_tag=None):
+        """Elementos tag completos, en orden; cada uno se libera al pedir el siguiente"""
+        for _, elem in ET.iterparse(f, events=('end',), tag=tag, resolve_entities=False):
+            yield elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+else:
+    _fromstring = ET.fromstring
+
+    def _iter_tag(f, tag, parent_tag=None):
+        """
+        Elementos tag completos, en orden; cada uno se libera al pedir el siguiente.
+
+        parent_tag es el padre directo de tag (None = raíz): se limpia tras cada
+        elemento, porque elem.clear() solo lo vacía y lo deja colgando del padre.
+        """
+        parent = None
+        for event, elem in ET.iterparse(f, events=('start', 'end')):
+            if event == 'start':
+                if parent is None and (parent_tag is None or elem.tag == parent_tag):
+                    parent = elem
+            elif elem.tag == tag:
+                yield elem
+                (parent if parent is not None else elem).clear()
+
+
+def _rich_text(elem):
+    """Texto de un si/is: t directo o runs r/t (se ignoran las guías fonéticas rPh)"""
+    parts = []
+    for child in elem:
+        if child.tag == _T:
+            parts.append(child.text or '')
+        elif child.tag == _R:
+            t = child.find(_T)
+            if t is not None:
+                parts.append(t.text or '')
+    return ''.join(parts)
+
+
+def read_shared_strings(z):
+    try:
+        f = z.open('xl/sharedStrings.xml')
+    except KeyError:
+        return []
+    with f:
+        return [_rich_text(si) for si in _iter_tag(f, _SI)]
+
+
+def get_sheet_names(z):
+    try:
+        data = z.read('xl/workbook.xml')
+    except KeyError:
+        return []
+    root = _fromstring(data)
+    if HAVE_LXML:
+        # XPath precompilado: se evalúa en C
+        return [str(name) for name in _SHEET_NAMES(root)]
+    ns = {'m': NS_MAIN}
+    return [s.get('name') for s in root.findall('.//m:sheets/m:sheet', ns)]
+
+
+def _workbook_sheets(z):
+    """
+    (nombres de hoja en el orden del libro, {nombre: ruta del xml}, índice activo).
+
+    El índice activo es bookViews/workbookView/@activeTab (0 si no está), el
+    mismo que usa openpyxl para wb.active.
+    """
+    try:
+        workbook = _fromstring(z.read('xl/workbook.xml'))
+        rels = _fromstring(z.read('xl/_rels/workbook.xml.rels'))
+    except KeyError:
+        return [], {}, 0
+    targets = {r.get('Id'): r.get('Target') for r in rels.iter(f'{{{NS_PKG_REL}}}Relationship')}
+    names = []
+    paths = {}
+    for s in workbook.iter(f'{{{NS_MAIN}}}sheet'):
+        names.append(s.get('name'))
+        target = targets.get(s.get(f'{{{NS_REL}}}id'))
+        if target is None:
+            continue
+        # Target es relativo a xl/ (o absoluto desde la raíz del paquete)
+        path = target.lstrip('/') if target.startswith('/') else posixpath.normpath(posixpath.join('xl', target))
+        paths[s.get('name')] = path
+    view = workbook.find(f'{{{NS_MAIN}}}bookViews/{{{NS_MAIN}}}workbookView')
+    try:
+        active = int(view.get('activeTab', 0)) if view is not None else 0
+    except ValueError:
+        active = 0
+    return names, paths, active
+
+
+def sheet_paths(z):
+    """{nombre de hoja: ruta del xml} en el orden del libro"""
+    return _workbook_sheets(z)[1]
+
+
+def _col_index(ref):
+    """'C12' → 2"""
+    idx = 0
+    for ch in ref:
+        if 'A' <= ch <= 'Z':
+            idx = idx * 26 + (ord(ch) - 64)
+        else:
+            break
+    return idx - 1
+
+
+def _cell_value(c, shared):
+    t = c.get('t')
+    if t == 'inlineStr':
+        is_elem = c.find(_IS)
+        return _rich_text(is_elem) if is_elem is not None else ''
+    v = c.find(_V)
+    if v is None or v.text is None:
+        return None
+    text = v.text
+    if t == 's':
+        idx = int(text)
+        return shared[idx] if idx < len(shared) else text
+    if t == 'b':
+        return text == '1'
+    if t in ('str', 'e'):
+        return text
+    # numérico
+    try:
+        n = float(text)
+    except ValueError:
+        return text
+    return int(n) if n.is_integer() else n
+
+
+def _cell_text(c, shared):
+    """Texto crudo de la celda: shared string resuelto, el resto tal cual ('' si no hay valor)"""
+    v = c.find(_V)
+    if v is not None and v.text is not None:
+        if c.get('t') == 's':
+            idx = int(v.text)
+            return shared[idx] if idx < len(shared) else v.text
+        return v.text
+    is_elem = c.find(_IS)
+    return _rich_text(is_elem) if is_elem is not None else ''
+
+
+def _row_cells(row, shared):
+    """Valores de un elemento row ubicados por la referencia de la celda (huecos = None)"""
+    cells = []
+    for c in row.iter(_C):
+        ref = c.get('r')
+        col = _col_index(ref) if ref else len(cells)
+        if col >= len(cells):
+            cells.extend([None] * (col - len(cells) + 1))
+        cells[col] = _cell_value(c, shared)
+    return cells
+
+
+def iter_rows(z, sheet_path, shared, columns=None, min_row=1, raw=False):
+    """
+    Iterar filas de una hoja sin materializar el DOM.
+
+    Cada fila se entrega como lista de valores ubicados según la referencia de
+    la celda (celdas vacías = None). Con columns (índices 0-based) se entrega
+    solo una tupla con esas columnas. min_row es 1-based, como en openpyxl.
+    La memoria residente es O(fila): cada fila se descarta tras entregarla.
+
+    raw=True (para diagnóstico, sin columns): lista con el texto crudo de las
+    celdas presentes en orden de documento, sin tipar números ni rellenar
+    huecos con None.
+    """
+    # Proyección (como usecols): solo se decodifican las celdas pedidas
+    wanted = None if columns is None else {col: pos for pos, col in enumerate(columns)}
+    # Las celdas de una fila vienen en orden de columna: pasada la última
+    # columna pedida no hay nada más que mirar (como iter_cols(max_col=...))
+    last_col = max(columns, default=-1) if columns is not None else None
+    with z.open(sheet_path) as f:
+        n_row = 0
+        for elem in _iter_tag(f, _ROW, _SHEET_DATA):
+            r = elem.get('r')
+            n_row = int(r) if r else n_row + 1
+            if n_row >= min_row:
+                if raw:
+                    yield [_cell_text(c, shared) for c in elem.iter(_C)]
+                elif wanted is None:
+                    yield _row_cells(elem, shared)
+                else:
+                    out = [None] * len(columns)
+                    col = -1
+                    for c in elem.iter(_C):
+                        ref = c.get('r')
+                        col = _col_index(ref) if ref else col + 1
+                        if col > last_col:
+                            break
+                        pos = wanted.get(col)
+                        if pos is not None:
+                            out[pos] = _cell_value(c, shared)
+                    yield tuple(out)
+
+
+def open_sheet(path, sheet=None):
+    """
+    Abrir un xlsx y retornar (zipfile, ruta de la hoja, shared strings).
+
+    sheet puede ser un nombre, una posición (0 = primera hoja, como
+    sheet_name=0 de pandas) o None para la hoja activa (como wb.active de
+    openpyxl). El llamador cierra el zip.
+    """
+    z = zipfile.ZipFile(path, 'r')
+    try:
+        names, paths, active = _workbook_sheets(z)
+        if not names:
+            raise KeyError('El libro no tiene hojas')
+        if sheet is None:
+            # activeTab fuera de rango: quedarse con la primera hoja
+            sheet = active if 0 <= active < len(names) else 0
+        if isinstance(sheet, int):
+            if not 0 <= sheet < len(names):
+                raise KeyError(f'Worksheet index {sheet} is invalid, {len(names)} worksheets found')
+            sheet = names[sheet]
+        if sheet not in paths:
+            raise KeyError(f'Worksheet {sheet} does not exist.')
+        return z, paths[sheet], read_shared_strings(z)
+    except Exception:
+        z.close()
+        raise
+
+
+def read_rows(path, sheet=None, columns=None, min_row=1):
+    """iter_rows sobre el archivo path; abre y cierra el zip"""
+    z, sheet_path, shared = open_sheet(path, sheet)
+    with z:
+        yield from iter_rows(z, sheet_path, shared, columns=columns, min_row=min_row)
+
+
+def read_columns(path, names, sheet=0):
+    """
+    Filas siguientes al encabezado, con las columnas de encabezado names en ese orden.
+
+    Como pd.read_excel, por defecto lee la primera hoja (no la activa). El
+    encabezado es el primer row presente en el xml (las filas vacías iniciales
+    no se escriben); los datos empiezan en la fila siguiente a él. Una columna
+    ausente entrega None. El zip y los shared strings se abren una sola vez:
+    el encabezado es una pasada corta que se detiene en su fila, y los datos
+    una segunda pasada proyectada.
+    """
+    z, sheet_path, shared = open_sheet(path, sheet)
+    with z:
+        header, header_row = [], 1
+        with z.open(sheet_path) as f:
+            rows = _iter_tag(f, _ROW, _SHEET_DATA)
+            try:
+                elem = next(rows, None)
+                if elem is not None:
+                    header_row = int(elem.get('r') or 1)
+                    header = [str(h).strip() if h is not None else '' for h in _row_cells(elem, shared)]
+            finally:
+                rows.close()
+        # Índice -1 no existe en ninguna fila → None
+        columns = tuple(header.index(n) if n in header else -1 for n in names)
+        yield from iter_rows(z, sheet_path, shared, columns=columns, min_row=header_row + 1)
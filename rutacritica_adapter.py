@@ -2,39 +2,70 @@
 import sys
 import os
 import json
+import contextlib
+import importlib.util
 from pathlib import Path
 
-# Cambiar al directorio de RutaCritica
-os.chdir(r"/home/ignatus/Documents/GitHub/GA_Backend/RutaCritica")
-sys.path.insert(0, r"/home/ignatus/Documents/GitHub/GA_Backend/RutaCritica")
+# Directorio de RutaCritica resuelto junto a este archivo
+RUTACRITICA_DIR = Path(__file__).resolve().parent / "RutaCritica"
+
+
+@contextlib.contextmanager
+def en_directorio(path):
+    """
+    Cambiar el cwd solo durante el bloque (como contextlib.chdir de 3.11).
+
+    rutaCritica.py/extract_data leen sus datos con rutas relativas; hasta que
+    las resuelvan desde __file__, el cambio se limita a la carga y a la llamada
+    en vez de quedar fijo para todo el proceso.
+    """
+    anterior = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(anterior)
+
+# Al final de sys.path: solo para los imports hermanos de rutaCritica.py
+# (extract_data, ...); stdlib y site-packages se resuelven antes
+if str(RUTACRITICA_DIR) not in sys.path:
+    sys.path.append(str(RUTACRITICA_DIR))
 
 # Suprimir la ejecución automática al importar
 import numpy as np
 import pandas as pd
 import networkx as nx
 
-# Cargar el módulo manualmente sin ejecutar el código al final
-with open("rutaCritica.py", "r", encoding="utf-8") as f:
-    code = f.read()
-    
-# Encontrar donde está la llamada getRamoCritico('MiMalla.xlsx')
-# y removerla temporalmente para poder importar
-code_lines = code.split("\n")
-exec_globals = {"__name__": "__main__", "np": np, "pd": pd, "nx": nx}
+# Cargar el módulo sin ejecutar la llamada final getRamoCritico('MiMalla.xlsx')
+AUTORUN = "getRamoCritico('MiMalla.xlsx')"
+spec = importlib.util.spec_from_file_location("rutaCritica", RUTACRITICA_DIR / "rutaCritica.py")
+rutacritica = importlib.util.module_from_spec(spec)
+with open(spec.origin, "r", encoding="utf-8") as f:
+    code_lines = f.read().split("\n")
+rutacritica.__dict__.update({"np": np, "pd": pd, "nx": nx})
 
-# Ejecutar solo las funciones, no la llamada final
-for i, line in enumerate(code_lines):
-    if line.strip().startswith("getRamoCritico('MiMalla.xlsx')"):
-        # No ejecutar esta línea
-        continue
-    exec("\n".join(code_lines[:i+1]), exec_globals)
+if not any(line.startswith(AUTORUN) for line in code_lines):
+    # rutaCritica.py ya protege la llamada con if __name__ == '__main__':
+    # import normal (usa el caché .pyc en las siguientes ejecuciones)
+    with en_directorio(RUTACRITICA_DIR):
+        spec.loader.exec_module(rutacritica)
+else:
+    # Versión sin proteger: remover la llamada una sola vez y compilar el
+    # módulo completo de una vez (antes: exec de cada prefijo, O(L²)).
+    # Solo la llamada sin indentar, con el mismo criterio que la detección:
+    # una llamada dentro de un bloque (if __name__ == '__main__':) se conserva
+    # para no dejar el bloque vacío
+    code = "\n".join(line for line in code_lines if not line.startswith(AUTORUN))
+    with en_directorio(RUTACRITICA_DIR):
+        exec(compile(code, spec.origin, "exec"), rutacritica.__dict__)
 
 # Ahora getRamoCritico está disponible
-getRamoCritico = exec_globals["getRamoCritico"]
+getRamoCritico = rutacritica.getRamoCritico
 
 # Ejecutar
 try:
-    ramos_disponibles, malla_name = getRamoCritico(r"/home/ignatus/Documents/GitHub/GA_Backend/RutaCritica/MiMalla.xlsx")
+    with en_directorio(RUTACRITICA_DIR):
+        ramos_disponibles, malla_name = getRamoCritico(str(RUTACRITICA_DIR / "MiMalla.xlsx"))
     
     result = {
         "success": True,
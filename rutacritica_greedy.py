@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Clique greedy multi-seed sobre matriz de adyacencia empaquetada en bits.
+
+Port del greedy de quickshift (src/algorithm/clique.rs) para que los
+benchmarks contra RutaCritica comparen el mismo algoritmo en lugar de
+nx.max_weight_clique (NP-completo).
+
+La adyacencia se guarda como uint64 de forma (N, ceil(N/64)): el bit j de
+la fila i indica que las secciones i y j son compatibles. Los vecinos
+comunes de un clique son el AND de sus filas. El horario de cada sección es
+también un bitmask (medias horas de la semana), así un conflicto es un AND.
+
+Uso: python3 rutacritica_greedy.py secciones.json
+     (lista de {"codigo", "codigo_box", "horario": [...], "prioridad"})
+"""
+import sys
+import re
+import json
+
+import numpy as np
+
+from rutacritica_numba import njit, prange
+
+
+def bits_to_mask(row, n):
+    """Fila de bits uint64 → máscara booleana de largo n"""
+    return np.unpackbits(row.astype('<u8').view(np.uint8), bitorder='little')[:n].astype(bool)
+
+
+# Grilla semanal: 6 días × 48 medias horas (00:00-24:00) = 288 bits = 5 uint64.
+# Cubre el día completo para que ningún bloque parseable quede sin bits
+DIAS = ('LU', 'MA', 'MI', 'JU', 'VI', 'SA')
+_INICIO_GRILLA = 0
+_SLOTS_POR_DIA = 48
+_BITS_GRILLA = len(DIAS) * _SLOTS_POR_DIA
+
+_HORA = re.compile(r'(\d{1,2}):(\d{2})')
+
+
+def parse_horario(horario):
+    """
+    "LU MI 08:30 - 10:00" → (días, inicio, fin) en minutos; None si no se entiende.
+
+    Exige al menos un día (LU-SA) y dos horas HH:MM. A diferencia de
+    parse_horario_range/extract_days_from_horario en clique.rs, acepta SA y
+    rechaza horarios sin día ("08:30-10:00"), que quedan como string opaco.
+    """
+    dias = [t for t in horario.upper().split() if t in DIAS]
+    horas = _HORA.findall(horario)
+    if not dias or len(horas) < 2:
+        return None
+    inicio = int(horas[0][0]) * 60 + int(horas[0][1])
+    fin = int(horas[1][0]) * 60 + int(horas[1][1])
+    if fin <= inicio:
+        return None
+    return dias, inicio, fin
+
+
+def schedule_bits(horarios, extra_ids):
+    """
+    Posiciones de bit ocupadas por una lista de horarios.
+
+    Bloques parseables ocupan sus medias horas de la grilla; los que no se
+    entienden (o caen fuera de ella, p. ej. "LU 25:00 - 26:00") reciben un bit
+    propio por string (extra_ids) después de la grilla, así dos horarios
+    idénticos siempre chocan.
+    """
+    bits = set()
+    for h in horarios:
+        parsed = parse_horario(h)
+        if parsed is not None:
+            dias, inicio, fin = parsed
+            desde = max(0, (inicio - _INICIO_GRILLA) // 30)
+            hasta = min(_SLOTS_POR_DIA, -(-(fin - _INICIO_GRILLA) // 30))
+        if parsed is None or desde >= hasta:
+            bits.add(_BITS_GRILLA + extra_ids.setdefault(h, len(extra_ids)))
+            continue
+        for d in dias:
+            base = DIAS.index(d) * _SLOTS_POR_DIA
+            bits.update(range(base + desde, base + hasta))
+    return bits
+
+
+def sections_compatible(s1, s2):
+    """
+    Distinto codigo_box, distinto curso y ninguna media hora en común.
+
+    Más estricto que sections_conflict de clique.rs, que solo compara los
+    strings de horario completos: aquí "LU 08:30 - 10:00" y "LU 09:00 - 10:30"
+    chocan por solaparse. Dos horarios idénticos chocan en ambos lados.
+
+    >>> a = {'codigo': 'CIT1010-1', 'codigo_box': 'A', 'horario': ['LU 06:00 - 06:50']}
+    >>> b = {'codigo': 'CBM1006-1', 'codigo_box': 'B', 'horario': ['LU 06:00 - 06:50']}
+    >>> sections_compatible(a, b)
+    False
+    >>> b['horario'] = ['MA 23:00 - 23:50']
+    >>> sections_compatible(a, b), sections_compatible(b, dict(a, horario=b['horario']))
+    (True, False)
+    >>> sections_compatible(dict(a, horario=['LU 08:30 - 10:00']), dict(b, horario=['LU 09:00 - 10:30']))
+    False
+    """
+    if s1['codigo_box'] == s2['codigo_box']:
+        return False
+    if s1['codigo'][:7] == s2['codigo'][:7]:
+        return False
+    extra = {}
+    return not (schedule_bits(s1['horario'], extra) & schedule_bits(s2['horario'], extra))
+
+
+def encode_secciones(secciones):
+    """
+    Codificar secciones como arreglos (SoA) para el kernel compilado.
+
+    Retorna (masks[N,W] uint64, box[N] int32, curso[N] int32): masks es el
+    bitmask semanal de cada sección; box y curso son ids de codigo_box y de los
+    7 primeros caracteres del código.
+    """
+    n = len(secciones)
+    extra_ids, ids_box, ids_curso = {}, {}, {}
+    ocupados = [schedule_bits(s['horario'], extra_ids) for s in secciones]
+    words = (_BITS_GRILLA + len(extra_ids) + 63) // 64
+    masks = np.zeros((n, words), dtype=np.uint64)
+    box = np.empty(n, dtype=np.int32)
+    curso = np.empty(n, dtype=np.int32)
+    for i, s in enumerate(secciones):
+        for b in ocupados[i]:
+            masks[i, b >> 6] |= np.uint64(1) << np.uint64(b & 63)
+        box[i] = ids_box.setdefault(s['codigo_box'], len(ids_box))
+        curso[i] = ids_curso.setdefault(s['codigo'][:7], len(ids_curso))
+    return masks, box, curso
+
+
+@njit(parallel=True, cache=True)
+def _build_adjacency_kernel(masks, box, curso):
+    n, words = masks.shape
+    adj = np.zeros((n, (n + 63) // 64), dtype=np.uint64)
+    # Cada hilo escribe solo su fila i (recorre todos los j): sin carreras entre filas
+    for i in prange(n):
+        for j in range(n):
+            if i == j or box[i] == box[j] or curso[i] == curso[j]:
+                continue
+            # Conflicto = algún bit de horario en común: un AND/OR por palabra
+            choque = np.uint64(0)
+            for w in range(words):
+                choque |= masks[i, w] & masks[j, w]
+            if choque == 0:
+                adj[i, j >> 6] |= np.uint64(1) << np.uint64(j & 63)
+    return adj
+
+
+def build_adjacency(secciones):
+    """Matriz de compatibilidad empaquetada (N, ceil(N/64)) uint64"""
+    if not secciones:
+        return np.zeros((0, 0), dtype=np.uint64)
+    return _build_adjacency_kernel(*encode_secciones(secciones))
+
+
+def greedy_clique(adj, pesos, seed, max_size=6):
+    """Expande un clique desde seed agregando siempre el vecino común de mayor peso"""
+    n = len(pesos)
+    clique = [seed]
+    comunes = adj[seed].copy()
+    while len(clique) < max_size and comunes.any():
+        mask = bits_to_mask(comunes, n)
+        # argmax retorna el primer índice en empate (orden determinista como en Rust)
+        v = int(np.where(mask, pesos, -np.inf).argmax())
+        clique.append(v)
+        comunes &= adj[v]
+    return clique
+
+
+def greedy_multiseed(adj, pesos, k=32, max_size=6):
+    """
+    Greedy desde las k semillas de mayor peso. O(k·N·N/64).
+
+    Retorna lista de (clique, peso) sin duplicados, ordenada por peso descendente.
+    """
+    pesos = np.asarray(pesos, dtype=np.float64)
+    # argsort estable sobre -pesos: prioridad descendente, luego índice ascendente
+    seeds = np.argsort(-pesos, kind='stable')[:k]
+    vistos = set()
+    resultados = []
+    for seed in seeds:
+        if pesos[seed] == -np.inf:
+            # Nodo fuera del grafo (ver clique_partition)
+            break
+        clique = greedy_clique(adj, pesos, int(seed), max_size)
+        clave = tuple(sorted(clique))
+        if clave in vistos:
+            continue
+        vistos.add(clave)
+        resultados.append((clique, float(pesos[clique].sum())))
+    resultados.sort(key=lambda r: -r[1])
+    return resultados
+
+
+def max_weight_clique(adj, pesos, k=32, max_size=6):
+    """Reemplazo de nx.max_weight_clique: mejor clique encontrado por el greedy"""
+    resultados = greedy_multiseed(adj, pesos, k, max_size)
+    return resultados[0] if resultados else ([], 0.0)
+
+
+def clique_partition(adj, pesos, umbral=0.0, max_soluciones=None, k=32, max_size=6):
+    """
+    Soluciones alternativas por CLIQUE PARTITION greedy (2-aproximación).
+
+    Toma el clique de mayor peso X, lo guarda y repite sobre G - X, hasta que
+    no quede un clique con peso >= umbral. Quitar X es limpiar sus bits en
+    todas las filas (adj &= ~mask_X) y anular sus pesos.
+    """
+    adj = adj.copy()
+    pesos = np.array(pesos, dtype=np.float64)
+    soluciones = []
+    while max_soluciones is None or len(soluciones) < max_soluciones:
+        clique, peso = max_weight_clique(adj, pesos, k, max_size)
+        if not clique or peso < umbral:
+            break
+        soluciones.append((clique, peso))
+        mask_x = np.zeros(adj.shape[1], dtype=np.uint64)
+        for v in clique:
+            mask_x[v >> 6] |= np.uint64(1) << np.uint64(v & 63)
+        adj &= ~mask_x
+        adj[clique] = 0
+        pesos[clique] = -np.inf
+    return soluciones
+
+
+def main():
+    if len(sys.argv) < 2:
+        print('Uso: python3 rutacritica_greedy.py secciones.json')
+        return 1
+    with open(sys.argv[1], 'r', encoding='utf-8') as f:
+        secciones = json.load(f)
+    adj = build_adjacency(secciones)
+    pesos = [s.get('prioridad', 0) for s in secciones]
+    for clique, peso in clique_partition(adj, pesos, max_soluciones=10):
+        print(peso, [secciones[i]['codigo_box'] for i in clique])
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
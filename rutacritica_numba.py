@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+njit/prange de numba, o un reemplazo sin compilar si numba no está instalado.
+
+Compartido por rutacritica_greedy.py y rutacritica_pert.py para que ninguno
+dependa del otro solo por este shim.
+"""
+try:
+    from numba import njit, prange
+except ImportError:
+    # Sin numba: mismo código interpretado (lento, pero correcto)
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda f: f
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+PERT por orden topológico (forward/backward pass) en O(N + E).
+
+Reemplazo de set_values_recursive de RutaCritica (nx.ancestors +
+nx.all_simple_paths, exponencial con caminos reconvergentes) siguiendo el
+mismo esquema que quickshift (src/algorithm/pert.rs): cada nodo depende solo
+de sus predecesores, así que un barrido en orden topológico calcula ES/EF y
+el barrido inverso LS/LF.
+
+El grafo se representa como arreglos CSR int32 (indptr, indices) para
+predecesores y sucesores.
+"""
+import numpy as np
+
+from rutacritica_numba import njit
+
+
+def build_csr(n, edges):
+    """
+    Construir listas CSR de predecesores y sucesores.
+
+    edges: iterable de (u, v) con u prerequisito de v.
+    Retorna (pred_indptr, pred_indices, succ_indptr, succ_indices).
+    """
+    edges = np.asarray(list(edges), dtype=np.int32).reshape(-1, 2)
+    src, dst = edges[:, 0], edges[:, 1]
+
+    def _csr(filas, cols):
+        orden = np.argsort(filas, kind='stable')
+        indptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(filas, minlength=n), out=indptr[1:])
+        return indptr, cols[orden].astype(np.int32)
+
+    pred_indptr, pred_indices = _csr(dst, src)
+    succ_indptr, succ_indices = _csr(src, dst)
+    return pred_indptr, pred_indices, succ_indptr, succ_indices
+
+
+def topological_order(n, succ_indptr, succ_indices):
+    """
+    Orden topológico (Kahn) como int32; ValueError si hay ciclos.
+
+    >>> _, _, succ_indptr, succ_indices = build_csr(3, [(0, 1), (1, 2), (2, 0)])
+    >>> topological_order(3, succ_indptr, succ_indices)
+    Traceback (most recent call last):
+        ...
+    ValueError: El grafo PERT contiene ciclos
+    """
+    grado = np.bincount(succ_indices, minlength=n)
+    pila = [v for v in range(n) if grado[v] == 0]
+    orden = []
+    while pila:
+        u = pila.pop()
+        orden.append(u)
+        for v in succ_indices[succ_indptr[u]:succ_indptr[u + 1]]:
+            grado[v] -= 1
+            if grado[v] == 0:
+                pila.append(int(v))
+    if len(orden) != n:
+        raise ValueError("El grafo PERT contiene ciclos")
+    return np.asarray(orden, dtype=np.int32)
+
+
+@njit(cache=True)
+def _forward_backward(order, pred_indptr, pred_indices, succ_indptr, succ_indices, dur):
+    n = order.shape[0]
+    es = np.zeros(n, dtype=np.int32)
+    ef = np.zeros(n, dtype=np.int32)
+    for v in order:
+        inicio = 0
+        for k in range(pred_indptr[v], pred_indptr[v + 1]):
+            if ef[pred_indices[k]] > inicio:
+                inicio = ef[pred_indices[k]]
+        es[v] = inicio
+        ef[v] = inicio + dur[v]
+
+    fin = ef.max() if n > 0 else 0
+    lf = np.empty(n, dtype=np.int32)
+    ls = np.empty(n, dtype=np.int32)
+    for v in order[::-1]:
+        limite = fin
+        for k in range(succ_indptr[v], succ_indptr[v + 1]):
+            if ls[succ_indices[k]] < limite:
+                limite = ls[succ_indices[k]]
+        lf[v] = limite
+        ls[v] = limite - dur[v]
+    return es, ef, ls, lf, ls - es
+
+
+def pert(n, edges, dur=None):
+    """
+    Calcular ES, EF, LS, LF y holgura para n nodos (duración 1 por defecto).
+
+    Un nodo es crítico cuando su holgura es 0.
+
+    Diamante con caminos reconvergentes 0→1→3 y 0→2→3, donde 2 dura 2: el
+    camino crítico pasa por 2 y el nodo 1 tiene holgura 1.
+
+    >>> es, ef, ls, lf, h = pert(4, [(0, 1), (0, 2), (1, 3), (2, 3)], dur=[1, 1, 2, 1])
+    >>> es.tolist(), ef.tolist()
+    ([0, 1, 1, 3], [1, 2, 3, 4])
+    >>> ls.tolist(), lf.tolist(), h.tolist()
+    ([0, 2, 1, 3], [1, 3, 3, 4], [0, 1, 0, 0])
+
+    Grafo vacío:
+
+    >>> [a.tolist() for a in pert(0, [])]
+    [[], [], [], [], []]
+    """
+    dur = np.ones(n, dtype=np.int32) if dur is None else np.asarray(dur, dtype=np.int32)
+    pred_indptr, pred_indices, succ_indptr, succ_indices = build_csr(n, edges)
+    order = topological_order(n, succ_indptr, succ_indices)
+    return _forward_backward(order, pred_indptr, pred_indices, succ_indptr, succ_indices, dur)
+
+
+def pert_desde_grafo(G, dur_attr=None):
+    """
+    PERT sobre un nx.DiGraph de RutaCritica.
+
+    Retorna {nodo: {'es', 'ef', 'ls', 'lf', 'holgura', 'critico'}}.
+    """
+    nodos = list(G.nodes)
+    idx = {nodo: i for i, nodo in enumerate(nodos)}
+    edges = [(idx[u], idx[v]) for u, v in G.edges]
+    dur = None
+    if dur_attr is not None:
+        dur = [G.nodes[nodo].get(dur_attr, 1) for nodo in nodos]
+    es, ef, ls, lf, h = pert(len(nodos), edges, dur)
+    return {
+        nodo: {
+            'es': int(es[i]), 'ef': int(ef[i]),
+            'ls': int(ls[i]), 'lf': int(lf[i]),
+            'holgura': int(h[i]), 'critico': bool(h[i] == 0),
+        }
+        for i, nodo in enumerate(nodos)
+    }
@@ -6,7 +6,10 @@ Uso: python3 tools/inspect_oa.py [path/to/datafiles]
 import sys
 import os
 import zipfile
-import xml.etree.ElementTree as ET
+
+# Lector xlsx compartido con quickshift/verify_mapeo.py
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'quickshift'))
+from xlsx_fast import read_shared_strings, get_sheet_names, iter_rows  # noqa: E402
 
 def get_datafiles_dir():
     # Prefer env
@@ -28,36 +31,6 @@ def get_datafiles_dir():
     return os.path.join(cwd, 'quickshift', 'src', 'datafiles')
 
 
-def read_shared_strings(z):
-    try:
-        data = z.read('xl/sharedStrings.xml')
-    except KeyError:
-        return []
-    root = ET.fromstring(data)
-    ns = {'main': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
-    strings = []
-    for si in root.findall('.//main:si', ns):
-        # collect text from t elements inside si (may have r/t runs)
-        texts = []
-        for t in si.findall('.//main:t', ns):
-            texts.append(t.text or '')
-        strings.append(''.join(texts))
-    return strings
-
-
-def get_sheet_names(z):
-    try:
-        data = z.read('xl/workbook.xml')
-    except KeyError:
-        return []
-    root = ET.fromstring(data)
-    ns = {'m': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
-    names = []
-    for s in root.findall('.//m:sheets/m:sheet', ns):
-        names.append(s.get('name'))
-    return names
-
-
 def sheet_files(z):
     # return list of (sheet_path, sheet_name)
     sheets = []
@@ -70,33 +43,9 @@ def sheet_files(z):
 
 
 def extract_rows_from_sheet(z, sheet_path, shared):
-    data = z.read(sheet_path)
-    root = ET.fromstring(data)
-    ns = {'m': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
-    rows = []
-    for row in root.findall('.//m:sheetData/m:row', ns):
-        cells = []
-        for c in row.findall('m:c', ns):
-            # check type
-            t = c.get('t')
-            v = c.find('m:v', ns)
-            val = ''
-            if v is not None and v.text is not None:
-                if t == 's':
-                    idx = int(v.text)
-                    val = shared[idx] if idx < len(shared) else v.text
-                else:
-                    val = v.text
-            else:
-                # maybe inlineStr
-                is_elem = c.find('m:is', ns)
-                if is_elem is not None:
-                    t_el = is_elem.find('.//m:t', ns)
-                    if t_el is not None and t_el.text:
-                        val = t_el.text
-            cells.append(val)
-        rows.append(cells)
-    return rows
+    # Generador: las filas se procesan de a una, sin lista de la hoja completa.
+    # raw: texto tal como está en el xml, solo las celdas presentes
+    return iter_rows(z, sheet_path, shared, raw=True)
 
 
 def inspect_file(path):
@@ -110,9 +59,15 @@ def inspect_file(path):
             print('Worksheet files:', sfiles[:10])
             for sf in sfiles:
                 print('\n--', sf)
-                rows = extract_rows_from_sheet(z, sf, shared)
-                print('Rows count:', len(rows))
-                for i, r in enumerate(rows[:10]):
+                # Contar y guardar solo las 10 primeras en la misma pasada
+                first = []
+                count = 0
+                for r in extract_rows_from_sheet(z, sf, shared):
+                    if count < 10:
+                        first.append(r)
+                    count += 1
+                print('Rows count:', count)
+                for i, r in enumerate(first):
                     print(i, r)
     except Exception as e:
         print('ERROR reading xlsx:', e)